@@ -19,6 +19,13 @@ class Connection(QObject, Serializable):
     connection_made_incomplete = Signal(QObject)
     updated = Signal(QObject)
 
+    # Endpoints, kept as plain attributes for fast access; use connect_to
+    # and clear_node to change them
+    in_port: typing.Optional[Port]
+    out_port: typing.Optional[Port]
+    in_node: typing.Optional[Node]
+    out_node: typing.Optional[Node]
+
     def __init__(self, port_a: Port, port_b: Port = None, *,
                  style: StyleCollection, converter: TypeConverter = None):
         super().__init__()
@@ -41,10 +48,8 @@ class Connection(QObject, Serializable):
                 raise exceptions.PortsOfSameTypeError(
                     'Cannot connect two ports of the same type')
 
-        self._ports = {
-            PortType.input: in_port,
-            PortType.output: out_port
-        }
+        self._set_port(PortType.input, in_port)
+        self._set_port(PortType.output, out_port)
 
         if in_port is not None:
             if in_port.connections:
@@ -80,12 +85,27 @@ class Connection(QObject, Serializable):
         for port_type, port in self.valid_ports.items():
             if port.node.graphics_object is not None:
                 port.node.graphics_object.update()
-            self._ports[port] = None
 
         if self._graphics_object is not None:
             self._graphics_object._cleanup()
             self._graphics_object = None
 
+    def _set_port(self, port_type: PortType, port: typing.Optional[Port]):
+        node = port.node if port is not None else None
+        if port_type == PortType.input:
+            self.in_port, self.in_node = port, node
+        elif port_type == PortType.output:
+            self.out_port, self.out_node = port, node
+        else:
+            raise KeyError(port_type)
+
+    def _get_port(self, port_type: PortType) -> typing.Optional[Port]:
+        if port_type == PortType.input:
+            return self.in_port
+        elif port_type == PortType.output:
+            return self.out_port
+        raise KeyError(port_type)
+
     @property
     def style(self) -> StyleCollection:
         return self._style
@@ -204,18 +224,18 @@ class Connection(QObject, Serializable):
         ----------
         port : Port
         """
-        if self._ports[port.port_type] is not None:
+        if self._get_port(port.port_type) is not None:
             raise ValueError('Port already specified')
 
         was_incomplete = not self.is_complete
-        self._ports[port.port_type] = port
+        self._set_port(port.port_type, port)
         self.updated.emit(self)
         self.required_port = PortType.none
         if self.is_complete and was_incomplete:
             self.connection_completed.emit(self)
 
     def remove_from_nodes(self):
-        for port in self._ports.values():
+        for port in self.ports:
             if port is not None:
                 port.remove_connection(self)
 
@@ -242,18 +262,21 @@ class Connection(QObject, Serializable):
         -------
         value : Node
         """
-        port = self._ports[port_type]
-        return port.node if port is not None else None
+        if port_type == PortType.input:
+            return self.in_node
+        elif port_type == PortType.output:
+            return self.out_node
+        raise KeyError(port_type)
 
     @property
     def nodes(self):
         # TODO namedtuple; TODO order
-        return (self.get_node(PortType.input), self.get_node(PortType.output))
+        return (self.in_node, self.out_node)
 
     @property
     def ports(self):
         # TODO namedtuple; TODO order
-        return (self._ports[PortType.input], self._ports[PortType.output])
+        return (self.in_port, self.out_port)
 
     def get_port_index(self, port_type: PortType) -> int:
         """
@@ -267,7 +290,7 @@ class Connection(QObject, Serializable):
         -------
         index : int
         """
-        return self._ports[port_type].index
+        return self._get_port(port_type).index
 
     def clear_node(self, port_type: PortType):
         """
@@ -280,14 +303,15 @@ class Connection(QObject, Serializable):
         if self.is_complete:
             self.connection_made_incomplete.emit(self)
 
-        port = self._ports[port_type]
-        self._ports[port_type] = None
+        port = self._get_port(port_type)
+        self._set_port(port_type, None)
         port.remove_connection(self)
 
     @property
     def valid_ports(self):
         return {port_type: port
-                for port_type, port in self._ports.items()
+                for port_type, port in ((PortType.input, self.in_port),
+                                        (PortType.output, self.out_port))
                 if port is not None
                 }
 
@@ -337,7 +361,7 @@ class Connection(QObject, Serializable):
         -------
         value : bool
         """
-        return all(self._ports.values())
+        return self.in_port is not None and self.out_port is not None
 
     def propagate_data(self, node_data: NodeData):
         """
@@ -359,12 +383,12 @@ class Connection(QObject, Serializable):
     @property
     def input_node(self) -> Node:
         'Input node'
-        return self._ports[PortType.input].node
+        return self.in_node
 
     @property
     def output_node(self) -> Node:
         'Output node'
-        return self._ports[PortType.output].node
+        return self.out_node
 
     # For backward-compatibility:
     output = output_node
@@ -418,4 +442,5 @@ class Connection(QObject, Serializable):
         return self._required_port != PortType.none
 
     def __repr__(self):
-        return (f'<{self.__class__.__name__} ports={self._ports}>')
+        return (f'<{self.__class__.__name__} in_port={self.in_port} '
+                f'out_port={self.out_port}>')
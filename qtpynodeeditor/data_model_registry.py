@@ -125,10 +125,14 @@ class DataModelRegistry:
         """
         return self._categories
 
-    def get_type_converter(self, d1: NodeDataType, d2: NodeDataType) -> TypeConverter:
+    def get_type_converter(self, d1: NodeDataType, d2: NodeDataType
+                           ) -> typing.Optional[TypeConverter]:
         """
         Get type converter
 
+        This is a single dictionary lookup keyed on the ``(d1, d2)`` pair, so
+        it is cheap enough to call on every interaction.
+
         Parameters
         ----------
         d1 : NodeDataType
@@ -136,6 +140,7 @@ class DataModelRegistry:
 
         Returns
         -------
-        value : TypeConverter
+        value : TypeConverter or None
+            The registered converter, or None if there is none.
         """
         return self.type_converters.get((d1, d2), None)
@@ -13,6 +13,12 @@ class PortType(str, Enum):
     output = 'output'
 
 
+# Plain attributes, so that finding the opposite port is a single lookup
+PortType.none.opposite = PortType.none
+PortType.input.opposite = PortType.output
+PortType.output.opposite = PortType.input
+
+
 class ConnectionPolicy(str, Enum):
     one = 'one'
     many = 'many'
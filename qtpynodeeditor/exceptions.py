@@ -1,5 +1,19 @@
 class NodeConnectionFailure(Exception):
-    ...
+    '''
+    Base class for connection failures
+
+    As with logging, extra arguments are %-formatted into the message only
+    when the exception is converted to a string.
+    '''
+
+    def __str__(self):
+        if len(self.args) > 1 and isinstance(self.args[0], str):
+            msg, *args = self.args
+            try:
+                return msg % tuple(args)
+            except (TypeError, ValueError):
+                ...
+        return super().__str__()
 
 
 class ConnectionRequiresPortFailure(NodeConnectionFailure):
@@ -3,12 +3,13 @@ import typing
 from typing import Optional
 
 from qtpy.QtCore import QPointF
+from qtpy.QtGui import QTransform
 
 from .exceptions import (ConnectionCycleFailure, ConnectionDataTypeFailure,
                          ConnectionPointFailure, ConnectionPortNotEmptyFailure,
                          ConnectionRequiresPortFailure, ConnectionSelfFailure,
                          NodeConnectionFailure)
-from .port import PortType, opposite_port
+from .port import PortType
 from .type_converter import TypeConverter
 
 if typing.TYPE_CHECKING:
@@ -22,6 +23,13 @@ logger = logging.getLogger(__name__)
 
 
 class NodeConnectionInteraction:
+    __slots__ = (
+        '_node', '_connection', '_scene', 'connection_required_port',
+        '_conn_geom', '_conn_go', '_registry', '_node_geom', '_node_go',
+        '_node_state', '_node_scene_transform', '_conn_scene_transform',
+    )
+    connection_required_port: PortType
+
     def __init__(self, node: 'Node',
                  connection: 'Connection',
                  scene: 'FlowScene'):
@@ -39,6 +47,39 @@ class NodeConnectionInteraction:
         self._connection = connection
         self._scene = scene
 
+        # The required port type to complete the connection
+        self.connection_required_port = connection.required_port
+
+        # Cache what does not change over the lifetime of the interaction
+        self._conn_geom = connection.geometry
+        self._conn_go = connection.graphics_object
+        self._registry = scene.registry
+        if node is not None:
+            self._node_geom = node.geometry
+            self._node_go = node.graphics_object
+            self._node_state = node.state
+        else:
+            self._node_geom = self._node_go = self._node_state = None
+
+        # Lazily computed.  An interaction lives for a single mouse press or
+        # release, during which the node does not move.
+        self._node_scene_transform = None
+
+        # Likewise for the connection
+        self._conn_scene_transform = None
+
+    def _get_connection_scene_transform(self) -> QTransform:
+        '''The connection's scene transform, cached for this interaction'''
+        if self._conn_scene_transform is None:
+            self._conn_scene_transform = self._conn_go.sceneTransform()
+        return self._conn_scene_transform
+
+    def _get_scene_transform(self) -> QTransform:
+        '''The node's scene transform, cached for this interaction'''
+        if self._node_scene_transform is None:
+            self._node_scene_transform = self._node_go.sceneTransform()
+        return self._node_scene_transform
+
     @property
     def creates_cycle(self):
         """Would completing the connection introduce a cycle?"""
@@ -83,9 +124,10 @@ class NodeConnectionInteraction:
             raise ValueError(f'Invalid port specified {required_port}')
 
         # 1.5) Forbid connecting the node to itself
-        node = self.connection_node
-        if node == self._node:
-            raise ConnectionSelfFailure(f'Cannot connect {node} to itself')
+        opposite = required_port.opposite
+        node = self._connection.get_node(opposite)
+        if node is self._node:
+            raise ConnectionSelfFailure('Cannot connect %s to itself', node)
 
         # 2) connection point is on top of the node port
         connection_point = self.connection_end_scene_position(required_port)
@@ -93,40 +135,39 @@ class NodeConnectionInteraction:
                                                 connection_point)
         if not port:
             raise ConnectionPointFailure(
-                f'Connection point {connection_point} is not on node {node}')
+                'Connection point %s is not on node %s', connection_point,
+                node)
 
         # 3) Node port is vacant
         if not port.can_connect:
             raise ConnectionPortNotEmptyFailure(
-                f'Port {required_port} {port} cannot connect'
-            )
+                'Port %s %s cannot connect', required_port, port)
 
-        # 4) Cycle check
-        if self.creates_cycle:
+        # 4) Cycle check; as `creates_cycle`, reusing the values from above
+        if node.has_connection_by_port_type(self._node, required_port):
             raise ConnectionCycleFailure(
-                f'Connecting {self._node} and {node} would introduce a '
-                f'cycle in the graph'
-            )
+                'Connecting %s and %s would introduce a cycle in the graph',
+                self._node, node)
 
         # 5) Connection type equals node port type, or there is a registered
         #    type conversion that can translate between the two
-        connection_data_type = self._connection.data_type(opposite_port(required_port))
+        connection_data_type = self._connection.data_type(opposite)
 
         candidate_node_data_type = port.data_type
         if connection_data_type.id == candidate_node_data_type.id:
             return port, None
 
-        registry = self._scene.registry
-        if required_port == PortType.input:
-            converter = registry.get_type_converter(connection_data_type,
-                                                    candidate_node_data_type)
-        else:
-            converter = registry.get_type_converter(candidate_node_data_type,
-                                                    connection_data_type)
+        # Converters go from the output type to the input type; index by
+        # whether the candidate node provides the input end
+        type_out, type_in = (
+            (candidate_node_data_type, connection_data_type),
+            (connection_data_type, candidate_node_data_type),
+        )[required_port == PortType.input]
+        converter = self._registry.get_type_converter(type_out, type_in)
         if not converter:
             raise ConnectionDataTypeFailure(
-                f'{connection_data_type} and {candidate_node_data_type} are not compatible'
-            )
+                '%s and %s are not compatible', connection_data_type,
+                candidate_node_data_type)
 
         return port, converter
 
@@ -150,8 +191,9 @@ class NodeConnectionInteraction:
         try:
             port, converter = self.can_connect()
         except NodeConnectionFailure as ex:
-            logger.debug('Cannot connect node', exc_info=ex)
-            logger.info('Cannot connect node: %s', ex)
+            # Only include the traceback when debugging
+            logger.info('Cannot connect node: %s', ex,
+                        exc_info=logger.isEnabledFor(logging.DEBUG))
             return False
 
         # 1.5) If the connection is possible but a type conversion is needed,
@@ -165,12 +207,13 @@ class NodeConnectionInteraction:
         # 3) Assign Connection to empty port in NodeState
         # The port is not longer required after this function
         self._connection.connect_to(port)
+        self.connection_required_port = PortType.none
 
         # 4) Adjust Connection geometry
-        self._node.graphics_object.move_connections()
+        self._node_go.move_connections()
 
         # 5) Poke model to intiate data transfer
-        _, out_port = self._connection.ports
+        out_port = self._connection.out_port
         if out_port:
             out_port.node.on_data_updated(out_port)
 
@@ -188,7 +231,7 @@ class NodeConnectionInteraction:
         port_to_disconnect : PortType
         """
         port_index = self._connection.get_port_index(port_to_disconnect)
-        state = self._node.state
+        state = self._node_state
 
         # clear pointer to Connection in the NodeState
         state.erase_connection(port_to_disconnect, port_index,
@@ -200,24 +243,14 @@ class NodeConnectionInteraction:
         # clear Connection side
         self._connection.clear_node(port_to_disconnect)
         self._connection.required_port = port_to_disconnect
+        self.connection_required_port = port_to_disconnect
         self._connection.graphics_object.grabMouse()
 
-    @property
-    def connection_required_port(self) -> PortType:
-        """
-        The required port type to complete the connection
-
-        Returns
-        -------
-        value : PortType
-        """
-        return self._connection.required_port
-
     @property
     def connection_node(self):
         """The node already specified for the connection"""
         required_port = self.connection_required_port
-        return self._connection.get_node(opposite_port(required_port))
+        return self._connection.get_node(required_port.opposite)
 
     def connection_end_scene_position(self, port_type: PortType) -> QPointF:
         """
@@ -231,10 +264,8 @@ class NodeConnectionInteraction:
         -------
         value : QPointF
         """
-        go = self._connection.graphics_object
-        geometry = self._connection.geometry
-        end_point = geometry.get_end_point(port_type)
-        return go.mapToScene(end_point)
+        end_point = self._conn_geom.get_end_point(port_type)
+        return self._get_connection_scene_transform().map(end_point)
 
     def node_port_scene_position(self, port_type: PortType, port_index: int) -> QPointF:
         """
@@ -249,9 +280,8 @@ class NodeConnectionInteraction:
         -------
         value : QPointF
         """
-        port = self._node.state[port_type][port_index]
-        return port.get_mapped_scene_position(
-            self._node.graphics_object.sceneTransform())
+        port = self._node_state[port_type][port_index]
+        return port.get_mapped_scene_position(self._get_scene_transform())
 
     def node_port_under_scene_point(self,
                                     port_type: PortType,
@@ -268,9 +298,9 @@ class NodeConnectionInteraction:
         -------
         port : Port
         """
-        node_geom = self._node.geometry
-        scene_transform = self._node.graphics_object.sceneTransform()
-        return node_geom.check_hit_scene_point(port_type, scene_point, scene_transform)
+        scene_transform = self._get_scene_transform()
+        return self._node_geom.check_hit_scene_point(port_type, scene_point,
+                                                     scene_transform)
 
     def node_port_is_empty(self, port_type: PortType, port_index: int) -> bool:
         """
@@ -285,5 +315,4 @@ class NodeConnectionInteraction:
         -------
         value : bool
         """
-        port = self._node.state[port_type][port_index]
-        return port.can_connect
+        return self._node_state.port_is_empty(port_type, port_index)
@@ -1,4 +1,5 @@
 import inspect
+import sys
 from collections import namedtuple
 from typing import Optional
 
@@ -10,7 +11,21 @@ from .base import Serializable
 from .enums import ConnectionPolicy, NodeValidationState, PortType
 from .port import Port
 
-NodeDataType = namedtuple('NodeDataType', ('id', 'name'))
+
+class NodeDataType(namedtuple('NodeDataType', ('id', 'name'))):
+    '''
+    The type of data passed between nodes, identified by `id`
+
+    String ids are interned, so that comparing two ids is usually an
+    identity check.  Note that `_make` and `_replace` bypass the constructor
+    and do not intern.
+    '''
+    __slots__ = ()
+
+    def __new__(cls, id, name):
+        if type(id) is str:
+            id = sys.intern(id)
+        return super().__new__(cls, id, name)
 
 
 class NodeData:
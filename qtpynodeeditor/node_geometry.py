@@ -28,6 +28,7 @@ class NodeGeometry:
         self._spacing = 20
         self._style = node.style
         self._width = 100
+        self._port_positions = None
 
         f = QFont()
         f.setBold(True)
@@ -62,6 +63,7 @@ class NodeGeometry:
     @width.setter
     def width(self, width: int):
         self._width = int(width)
+        self._port_positions = None
 
     @property
     def entry_height(self) -> int:
@@ -77,6 +79,7 @@ class NodeGeometry:
     @entry_height.setter
     def entry_height(self, h: int):
         self._entry_height = int(h)
+        self._port_positions = None
 
     @property
     def entry_width(self) -> int:
@@ -107,6 +110,7 @@ class NodeGeometry:
     @spacing.setter
     def spacing(self, s: int):
         self._spacing = int(s)
+        self._port_positions = None
 
     @property
     def hovered(self) -> bool:
@@ -194,7 +198,11 @@ class NodeGeometry:
             Updates size unconditionally
         Otherwise,
             Updates size if the QFontMetrics is changed
+
+        Port positions are always recomputed, as the caption or style may
+        have changed since they were last cached.
         """
+        self._port_positions = None
         if font is not None:
             font_metrics = QFontMetrics(font)
             bold_font = QFont(font)
@@ -238,6 +246,10 @@ class NodeGeometry:
         """
         Port scene position
 
+        Positions are cached.  They follow the width, entry height and
+        spacing setters, but changes to the model's caption or the style
+        only take effect after `recalculate_size`.
+
         Parameters
         ----------
         port_type : PortType
@@ -248,24 +260,35 @@ class NodeGeometry:
         -------
         value : QPointF
         """
+        try:
+            x, y = self._get_port_positions(port_type)[index]
+        except KeyError:
+            raise ValueError(port_type) from None
+
+        result = QPointF(x, y)
         if t is None:
-            t = QTransform()
+            return result
+        return t.map(result)
 
-        step = self._entry_height + self._spacing
-        total_height = float(self.caption_height) + step * index
-        # TODO_UPSTREAM: why?
-        total_height += step / 2.0
-
-        if port_type == PortType.output:
-            x = self._width + self._style.connection_point_diameter
-            result = QPointF(x, total_height)
-        elif port_type == PortType.input:
-            x = -float(self._style.connection_point_diameter)
-            result = QPointF(x, total_height)
-        else:
-            raise ValueError(port_type)
+    def _get_port_positions(self, port_type: PortType) -> list:
+        '''
+        Port centers in node coordinates
 
-        return t.map(result)
+        Cached until `recalculate_size` or one of the width, entry height or
+        spacing setters is called.
+        '''
+        if self._port_positions is None:
+            step = self._entry_height + self._spacing
+            # TODO_UPSTREAM: why the half step?
+            first_y = float(self.caption_height) + step / 2.0
+            diameter = self._style.connection_point_diameter
+            self._port_positions = {
+                PortType.input: [(-float(diameter), first_y + step * i)
+                                 for i in range(self.num_sinks)],
+                PortType.output: [(self._width + diameter, first_y + step * i)
+                                  for i in range(self.num_sources)],
+            }
+        return self._port_positions[port_type]
 
     def check_hit_scene_point(self, port_type: PortType, scene_point: QPointF,
                               scene_transform: QTransform) -> typing.Optional[Port]:
@@ -291,17 +314,40 @@ class NodeGeometry:
         if port_type == PortType.none:
             return None
 
-        nearby_port = None
-
+        ports = self._node.state[port_type]
         tolerance = 2.0 * self._style.connection_point_diameter
-        for idx, port in self._node.state[port_type].items():
-            pos = port.get_mapped_scene_position(scene_transform) - scene_point
-            distance = math.sqrt(QPointF.dotProduct(pos, pos))
-            if distance < tolerance:
-                nearby_port = port
-                break
-
-        return nearby_port
+        if scene_transform.type() not in (QTransform.TxNone,
+                                          QTransform.TxTranslate):
+            for port in ports.values():
+                pos = port.get_mapped_scene_position(scene_transform) - scene_point
+                distance = math.sqrt(QPointF.dotProduct(pos, pos))
+                if distance < tolerance:
+                    return port
+            return None
+
+        positions = self._get_port_positions(port_type)
+        if not positions:
+            return None
+
+        # Ports are laid out in a single column, one every `step`.  Map the
+        # point back into node coordinates and only consider the ports
+        # vertically within `tolerance` of it, rather than all of them.
+        x = scene_point.x() - scene_transform.dx()
+        y = scene_point.y() - scene_transform.dy()
+        step = self._entry_height + self._spacing
+        first_y = positions[0][1]
+        first = max(0, math.ceil((y - tolerance - first_y) / step))
+        last = min(len(positions) - 1,
+                   math.floor((y + tolerance - first_y) / step))
+
+        tolerance_sq = tolerance * tolerance
+        for idx in range(first, last + 1):
+            port_x, port_y = positions[idx]
+            dx, dy = port_x - x, port_y - y
+            if dx * dx + dy * dy < tolerance_sq:
+                return ports[idx]
+
+        return None
 
     @property
     def resize_rect(self) -> QRect:
@@ -200,8 +200,8 @@ class NodePainter:
         reduced_diameter = diameter * 0.6
         for port in state.ports:
             scene_pos = port.scene_position
-            can_connect = port.can_connect
             port_type = port.port_type
+            can_connect = state.port_is_empty(port_type, port.index)
             data_type = port.data_type
 
             r = 1.0
@@ -1,3 +1,4 @@
+import functools
 import typing
 from collections import OrderedDict
 
@@ -30,6 +31,18 @@ class NodeState:
                 for i in range(num_ports)
             )
 
+        # Flat, index-addressable views of the above for the hot paths
+        self._input_port_list = list(self._ports[PortType.input].values())
+        self._output_port_list = list(self._ports[PortType.output].values())
+
+        # Bitmask of ports with at least one connection, per port type
+        self._input_occupied = 0
+        self._output_occupied = 0
+        for port in self.ports:
+            update = functools.partial(self._update_occupied, port)
+            port.connection_created.connect(update)
+            port.connection_deleted.connect(update)
+
         self._reaction = ReactToConnectionState.not_reacting
         self._reacting_port_type = PortType.none
         self._reacting_data_type = None
@@ -89,6 +102,56 @@ class NodeState:
         """
         return list(self._ports[port_type][port_index].connections)
 
+    def _update_occupied(self, port: Port, connection: 'Connection' = None):
+        attr = ('_input_occupied' if port.port_type == PortType.input
+                else '_output_occupied')
+        bit = 1 << port.index
+        if port.connections:
+            setattr(self, attr, getattr(self, attr) | bit)
+        else:
+            setattr(self, attr, getattr(self, attr) & ~bit)
+
+    def occupied(self, port_type: PortType) -> int:
+        """
+        Occupied ports
+
+        Parameters
+        ----------
+        port_type : PortType
+
+        Returns
+        -------
+        value : int
+            Bitmask where bit ``i`` is set if port ``i`` has a connection
+        """
+        if port_type == PortType.input:
+            return self._input_occupied
+        return self._output_occupied
+
+    def port_is_empty(self, port_type: PortType, port_index: int) -> bool:
+        """
+        Can the port accept another connection?
+
+        Unconnected ports are answered from the occupied bitmask, without
+        consulting the port's connection policy.
+
+        Parameters
+        ----------
+        port_type : PortType
+        port_index : int
+
+        Returns
+        -------
+        value : bool
+        """
+        if port_type == PortType.input:
+            occupied, ports = self._input_occupied, self._input_port_list
+        else:
+            occupied, ports = self._output_occupied, self._output_port_list
+        if not (occupied >> port_index) & 1:
+            return True
+        return ports[port_index].can_connect
+
     def erase_connection(self, port_type: PortType, port_index: int, connection: 'Connection'):
         """
         Erase connection
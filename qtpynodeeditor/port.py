@@ -16,6 +16,8 @@ def opposite_port(port: PortType) -> PortType:
     ----------
     port : PortType
     """
+    if isinstance(port, PortType):
+        return port.opposite
     return {PortType.input: PortType.output,
             PortType.output: PortType.input}.get(port, PortType.none)
 
@@ -141,15 +143,14 @@ class Port(QObject):
 
         Parameters
         ----------
-        port_type : PortType
-        port_index : int
+        transform : QTransform
+            The node's scene transform
 
         Returns
         -------
         value : QPointF
         """
-        ngo = self.node.graphics_object
-        return ngo.sceneTransform().map(self.scene_position)
+        return transform.map(self.scene_position)
 
     def __repr__(self):
         return (f'<{self.__class__.__name__} port_type={self.port_type} '
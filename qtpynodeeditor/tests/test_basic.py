@@ -1,7 +1,10 @@
+import pickle
+import sys
 import unittest.mock
 
 import pytest
 import qtpy.QtCore
+from qtpy.QtGui import QTransform
 
 import qtpynodeeditor as nodeeditor
 from qtpynodeeditor import PortType
@@ -47,6 +50,16 @@ class BasicOtherDataModel(nodeeditor.NodeDataModel):
     data_type = MyOtherNodeData.data_type
 
 
+class UnevenDataModel(nodeeditor.NodeDataModel):
+    name = 'MyUnevenDataModel'
+    caption = 'Caption'
+    caption_visible = True
+    num_ports = {'input': 2,
+                 'output': 5
+                 }
+    data_type = MyNodeData.data_type
+
+
 # @pytest.mark.parametrize("model_class", [...])
 @pytest.fixture(scope='function')
 def model():
@@ -159,6 +172,35 @@ def test_create_connection_with_converter(scene, view, model, other_model):
     scene.create_connection(node1[PortType.output][0], node2[PortType.input][0])
 
 
+def test_node_data_type():
+    interned = sys.intern('MyNodeDataTypeId')
+    data_type = nodeeditor.NodeDataType(id=''.join(['MyNodeData', 'TypeId']),
+                                        name='My Node Data Type')
+    assert data_type.id is interned
+    assert data_type.name == 'My Node Data Type'
+    assert repr(data_type) == (
+        "NodeDataType(id='MyNodeDataTypeId', name='My Node Data Type')")
+
+    assert data_type == nodeeditor.NodeDataType('MyNodeDataTypeId',
+                                                'My Node Data Type')
+    assert data_type == ('MyNodeDataTypeId', 'My Node Data Type')
+    assert data_type != nodeeditor.NodeDataType('Other', 'My Node Data Type')
+
+    unpickled = pickle.loads(pickle.dumps(data_type))
+    assert type(unpickled) is nodeeditor.NodeDataType
+    assert unpickled == data_type
+    assert unpickled.id is interned
+
+    # _replace and _make do not go through __new__, and so do not intern
+    replaced = data_type._replace(id=''.join(['MyNodeData', 'TypeId']))
+    assert replaced == data_type
+    assert replaced.id is not interned
+    made = nodeeditor.NodeDataType._make(
+        (''.join(['MyNodeData', 'TypeId']), 'My Node Data Type'))
+    assert made == data_type
+    assert made.id is not interned
+
+
 def test_clear_scene(scene, view, model):
     node1 = scene.create_node(model)
     node2 = scene.create_node(model)
@@ -258,7 +300,7 @@ def test_connection_cycles(scene, view, model):
     assert interaction.creates_cycle
 
 
-def test_smoke_connection_interaction(scene, view, model):
+def test_smoke_connection_interaction(scene, view, model, monkeypatch):
     node1 = scene.create_node(model)
     node2 = scene.create_node(model)
     conn = scene.create_connection(node1[PortType.output][0])
@@ -282,7 +324,8 @@ def test_smoke_connection_interaction(scene, view, model):
     assert interaction.connection_required_port == PortType.input
 
     # TODO node still not on it?
-    interaction.can_connect = lambda: (node1.state[PortType.input][0], None)
+    monkeypatch.setattr(nodeeditor.NodeConnectionInteraction, 'can_connect',
+                        lambda self: (node1.state[PortType.input][0], None))
 
     assert interaction.try_connect()
 
@@ -307,6 +350,43 @@ def test_connection_interaction_wrong_data_type(scene, view, model, other_model)
         interaction.can_connect()
 
 
+def test_connection_interaction_converter(scene, view, model, other_model):
+    converter = nodeeditor.type_converter.TypeConverter(MyNodeData.data_type,
+                                                        MyOtherNodeData.data_type,
+                                                        lambda x: None)
+    scene.registry.register_type_converter(MyNodeData.data_type,
+                                           MyOtherNodeData.data_type,
+                                           converter)
+    node1 = scene.create_node(model)
+    node2 = scene.create_node(other_model)
+
+    # Required input: drag from node1's output onto node2's input
+    conn = scene.create_connection(node1[PortType.output][0])
+    assert conn.required_port == PortType.input
+    interaction = nodeeditor.NodeConnectionInteraction(
+        node=node2, connection=conn, scene=scene)
+    pos = node2.geometry.port_scene_position(
+        PortType.input, 0, node2.graphics_object.sceneTransform())
+    conn.geometry.set_end_point(PortType.input,
+                                conn.graphics_object.mapFromScene(pos))
+    port, found = interaction.can_connect()
+    assert port is node2[PortType.input][0]
+    assert found is converter
+
+    # Required output: drag from node2's input back onto node1's output
+    conn = scene.create_connection(node2[PortType.input][0])
+    assert conn.required_port == PortType.output
+    interaction = nodeeditor.NodeConnectionInteraction(
+        node=node1, connection=conn, scene=scene)
+    pos = node1.geometry.port_scene_position(
+        PortType.output, 0, node1.graphics_object.sceneTransform())
+    conn.geometry.set_end_point(PortType.output,
+                                conn.graphics_object.mapFromScene(pos))
+    port, found = interaction.can_connect()
+    assert port is node1[PortType.output][0]
+    assert found is converter
+
+
 def test_locate_node(scene, view, model):
     node = scene.create_node(model)
     assert scene.locate_node_at(node.position, view.transform()) == node
@@ -387,3 +467,199 @@ def test_smoke_scene_signal_nodes(scene, view, model):
     scene.remove_node(node1)
     scene.remove_node(node2)
     assert mock.call_count == 2
+
+
+def _scan_port_under_point(node, port_type, scene_point, transform):
+    # Reference implementation: check every port, in order
+    tolerance = 2.0 * node.style.connection_point_diameter
+    for idx, port in node[port_type].items():
+        pos = node.geometry.port_scene_position(port_type, idx, transform)
+        delta = pos - scene_point
+        if qtpy.QtCore.QPointF.dotProduct(delta, delta) < tolerance ** 2:
+            return port
+
+
+@pytest.mark.parametrize('port_type', [PortType.input, PortType.output])
+@pytest.mark.parametrize('scale', [1.0, 2.0])
+def test_port_hit_test_matches_scan(scene, port_type, scale):
+    scene.registry.register_model(UnevenDataModel, category='My Category')
+    node = scene.create_node(UnevenDataModel)
+    node.position = (13.5, 27.25)
+    geom = node.geometry
+
+    transform = node.graphics_object.sceneTransform()
+    if scale != 1.0:
+        transform = QTransform.fromScale(scale, scale) * transform
+
+    tolerance = 2.0 * node.style.connection_point_diameter
+    step = (geom.entry_height + geom.spacing) * scale
+    offsets = [0.0, tolerance - 0.5, tolerance + 0.5, step / 2.0, 10 * step]
+    offsets += [-offset for offset in offsets]
+
+    for idx, port in node[port_type].items():
+        center = geom.port_scene_position(port_type, idx, transform)
+        assert geom.check_hit_scene_point(port_type, center, transform) is port
+        for dx in (0.0, tolerance - 0.5, tolerance + 0.5):
+            for dy in offsets:
+                point = center + qtpy.QtCore.QPointF(dx, dy)
+                expected = _scan_port_under_point(node, port_type, point,
+                                                  transform)
+                hit = geom.check_hit_scene_point(port_type, point, transform)
+                assert hit is expected
+
+
+def test_port_hit_test_tolerance(scene, model):
+    node = scene.create_node(model)
+    geom = node.geometry
+    transform = node.graphics_object.sceneTransform()
+    tolerance = 2.0 * node.style.connection_point_diameter
+
+    for port_type in (PortType.input, PortType.output):
+        for idx, port in node[port_type].items():
+            center = geom.port_scene_position(port_type, idx, transform)
+            for delta in (qtpy.QtCore.QPointF(0.0, tolerance - 0.5),
+                          qtpy.QtCore.QPointF(0.0, -(tolerance - 0.5)),
+                          qtpy.QtCore.QPointF(tolerance - 0.5, 0.0)):
+                assert geom.check_hit_scene_point(
+                    port_type, center + delta, transform) is port
+            for delta in (qtpy.QtCore.QPointF(0.0, tolerance + 0.5),
+                          qtpy.QtCore.QPointF(0.0, -(tolerance + 0.5)),
+                          qtpy.QtCore.QPointF(tolerance + 0.5, 0.0)):
+                assert geom.check_hit_scene_point(
+                    port_type, center + delta, transform) is None
+
+
+def _assert_occupied_in_sync(*nodes):
+    for node in nodes:
+        for port_type in (PortType.input, PortType.output):
+            expected = sum(1 << idx for idx, port in node[port_type].items()
+                           if port.connections)
+            assert node.state.occupied(port_type) == expected
+            for idx, port in node[port_type].items():
+                assert (node.state.port_is_empty(port_type, idx) ==
+                        port.can_connect)
+
+
+def test_occupied_mask_in_sync(scene, model):
+    node1 = scene.create_node(model)
+    node2 = scene.create_node(model)
+    _assert_occupied_in_sync(node1, node2)
+    assert node1.state.occupied(PortType.output) == 0
+
+    # Port.add_connection, via create_connection
+    conn = scene.create_connection(node1[PortType.output][2],
+                                   node2[PortType.input][1])
+    conn2 = scene.create_connection(node1[PortType.output][2],
+                                    node2[PortType.input][0])
+    _assert_occupied_in_sync(node1, node2)
+    assert node1.state.occupied(PortType.output) == 0b100
+    assert node2.state.occupied(PortType.input) == 0b011
+
+    # Connection.clear_node
+    conn2.clear_node(PortType.input)
+    _assert_occupied_in_sync(node1, node2)
+    assert node1.state.occupied(PortType.output) == 0b100
+    assert node2.state.occupied(PortType.input) == 0b010
+
+    # NodeState.erase_connection
+    node2.state.erase_connection(PortType.input, 1, conn)
+    _assert_occupied_in_sync(node1, node2)
+    assert node2.state.occupied(PortType.input) == 0
+
+    # FlowScene.delete_connection; the output port is only freed once both
+    # connections are gone
+    scene.delete_connection(conn)
+    _assert_occupied_in_sync(node1, node2)
+    assert node1.state.occupied(PortType.output) == 0b100
+    scene.delete_connection(conn2)
+    _assert_occupied_in_sync(node1, node2)
+    assert node1.state.occupied(PortType.output) == 0
+
+
+def test_port_positions_track_recalculate_size(scene, model):
+    node = scene.create_node(model)
+    geom = node.geometry
+    caption_height = geom.caption_height
+    assert caption_height > 0
+
+    before = geom.port_scene_position(PortType.input, 1)
+    node.model.caption_visible = False
+    geom.recalculate_size()
+    after = geom.port_scene_position(PortType.input, 1)
+    assert after.x() == before.x()
+    assert after.y() == before.y() - caption_height
+
+    geom.spacing = geom.spacing + 10
+    moved = geom.port_scene_position(PortType.input, 1)
+    assert moved.y() == after.y() + 15
+
+
+@pytest.mark.parametrize(
+    'args, expected',
+    [pytest.param(('Cannot connect %s to %s', 'a', 'b'),
+                  'Cannot connect a to b', id='lazy-format'),
+     pytest.param(('message', ), 'message', id='message'),
+     pytest.param(('a', 'b'), str(('a', 'b')), id='plain-args'),
+     pytest.param((1, 2), str((1, 2)), id='non-str-args'),
+     pytest.param(('%d', 'b'), str(('%d', 'b')), id='bad-format'),
+     ]
+)
+def test_connection_failure_str(args, expected):
+    assert str(nodeeditor.NodeConnectionFailure(*args)) == expected
+    assert str(nodeeditor.PortsOfSameTypeError(*args)) == expected
+
+
+def _assert_endpoints_consistent(conn):
+    assert conn.in_node is conn.get_node(PortType.input)
+    assert conn.out_node is conn.get_node(PortType.output)
+    assert conn.ports == (conn.in_port, conn.out_port)
+    assert conn.nodes == (conn.in_node, conn.out_node)
+    for port, node in ((conn.in_port, conn.in_node),
+                       (conn.out_port, conn.out_node)):
+        assert node is (port.node if port is not None else None)
+
+
+def test_connection_endpoints(scene, model):
+    node1 = scene.create_node(model)
+    node2 = scene.create_node(model)
+    out_port = node1[PortType.output][0]
+    in_port = node2[PortType.input][0]
+
+    conn = scene.create_connection(out_port)
+    _assert_endpoints_consistent(conn)
+    assert conn.out_port is out_port
+    assert conn.out_node is node1
+    assert conn.in_port is None
+    assert conn.in_node is None
+    assert not conn.is_complete
+
+    conn.connect_to(in_port)
+    _assert_endpoints_consistent(conn)
+    assert conn.in_port is in_port
+    assert conn.in_node is node2
+    assert conn.input_node is node2
+    assert conn.output_node is node1
+    assert conn.get_port_index(PortType.input) == 0
+    assert conn.is_complete
+
+    conn.clear_node(PortType.input)
+    _assert_endpoints_consistent(conn)
+    assert conn.in_port is None
+    assert conn.in_node is None
+    assert conn.out_node is node1
+    assert not conn.is_complete
+
+    with pytest.raises(KeyError):
+        conn.get_node(PortType.none)
+
+
+def test_connection_endpoints_survive_delete(scene, model):
+    node1 = scene.create_node(model)
+    node2 = scene.create_node(model)
+    conn = scene.create_connection(node1[PortType.output][1],
+                                   node2[PortType.input][2])
+    scene.delete_connection(conn)
+    # Handlers of connection_deleted may still inspect the endpoints
+    _assert_endpoints_consistent(conn)
+    assert conn.nodes == (node2, node1)
+    assert not conn.valid_ports[PortType.output].connections